@@ -103,18 +103,26 @@ class AutoTranslate(commands.Cog):
                 for val in possible_values
             ][:25]
 
-        choices = []
+        current = current.lower()
         # return starting matches first, then any match
-        for val in [
-            val for val in possible_values if val.lower().startswith(current.lower())
-        ]:
-            choices.append(app_commands.Choice(name=val.title(), value=val))
-            possible_values.remove(val)
-
-        for val in [val for val in possible_values if current.lower() in val.lower()]:
-            choices.append(app_commands.Choice(name=val.title(), value=val))
-
-        return choices[:25]
+        prefix = []
+        matched = set()
+        for val in possible_values:
+            if val.lower().startswith(current):
+                prefix.append(val)
+                matched.add(val)
+                if len(prefix) == 25:
+                    break
+
+        substr = [
+            val
+            for val in possible_values
+            if val not in matched and current in val.lower()
+        ][: 25 - len(prefix)]
+
+        return [
+            app_commands.Choice(name=val.title(), value=val) for val in prefix + substr
+        ]
 
     async def translate(
         self,
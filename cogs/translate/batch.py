@@ -0,0 +1,225 @@
+"""
+Request batching module for the Translation cog.
+
+Coalesces translation requests that arrive close together and share a
+language pair into a single translator call, so a busy server pays one
+network round-trip per batch instead of one per message.
+
+No Discord imports allowed - this module is pure business logic.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from .translator import Translator
+
+logger = logging.getLogger(__name__)
+
+BatchKey = tuple[str, str]
+"""A batch key: (target_language, source_language)."""
+
+_SEPARATOR_SIZE = Translator.encoded_size(Translator.BATCH_SEPARATOR)
+
+
+def _is_service_failure(error: Exception) -> bool:
+    """
+    Check whether a translation failed because of the service, not the text.
+
+    Timeouts, rate limiting (HTTP 429), server errors (5xx) and connection
+    failures would fail again for every text, so retrying them one by one
+    only multiplies the load on a service that is already struggling.
+
+    Args:
+        error: Exception raised by the translator
+
+    Returns:
+        True if the failure is not specific to the texts that were sent.
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    cause = error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        status = cause.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(cause, httpx.TransportError)
+
+
+class BatchQueue:
+    """
+    Collect translation requests and send them to the translator in batches.
+
+    Requests are grouped by (target_language, source_language). A background
+    task waits for the first request, lets more accumulate for BATCH_WINDOW
+    seconds, then sends each group via Translator.translate_batch(). A group
+    that reaches MAX_BATCH_ITEMS or MAX_BATCH_BYTES is sent immediately, and
+    a text that would push its group past MAX_BATCH_BYTES goes to a new one.
+
+    Attributes:
+        translator: Translator used to send batches
+    """
+
+    BATCH_WINDOW = 0.02
+    """Seconds to wait for more requests before sending a batch."""
+
+    MAX_BATCH_ITEMS = 10
+    """Maximum number of texts per batch."""
+
+    MAX_BATCH_BYTES = Translator.MAX_CHUNK_BYTES
+    """Maximum URL-encoded size of a joined batch, separators included.
+
+    Kept at the translator's chunk size so a batch always goes out as one
+    request instead of being re-split, possibly across a separator."""
+
+    def __init__(self, translator: Translator):
+        """
+        Initialize the batch queue.
+
+        Args:
+            translator: Translator used to send batches
+        """
+        self.translator = translator
+        self._pending: dict[BatchKey, list[tuple[str, asyncio.Future]]] = {}
+        self._pending_bytes: dict[BatchKey, int] = {}
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._sending: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """
+        Start the background task that sends batches.
+
+        Must be called from a running event loop. Calling it again while the
+        task is running has no effect.
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task, sending any requests still queued."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        for key in list(self._pending):
+            self._send(key)
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    async def submit(
+        self, text: str, target_language: str, source_language: str = "auto"
+    ) -> str:
+        """
+        Queue text for translation and wait for its result.
+
+        Falls back to a direct translator call if the queue isn't running.
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code. Defaults to "auto".
+
+        Returns:
+            Translated text.
+
+        Raises:
+            LanguageNotFoundError: If target language is not recognized
+            TranslationAPIError: If translation API call fails
+            asyncio.TimeoutError: If translation exceeds timeout
+        """
+        if self._worker is None or self._worker.done():
+            return await self.translator.translate(
+                text, target_language, source_language
+            )
+
+        key = (target_language, source_language)
+        # Count a separator per text, slightly overestimating the joined size
+        size = Translator.encoded_size(text) + _SEPARATOR_SIZE
+        if self._pending_bytes.get(key, 0) + size > self.MAX_BATCH_BYTES:
+            # Doesn't fit: send what's queued and start a new group
+            self._send(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append((text, future))
+        self._pending_bytes[key] = self._pending_bytes.get(key, 0) + size
+
+        if (
+            len(self._pending[key]) >= self.MAX_BATCH_ITEMS
+            or self._pending_bytes[key] >= self.MAX_BATCH_BYTES
+        ):
+            self._send(key)
+        else:
+            self._wakeup.set()
+
+        return await future
+
+    async def _run(self) -> None:
+        """Wait for requests, then send everything queued after the window."""
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.BATCH_WINDOW)
+            self._wakeup.clear()
+            for key in list(self._pending):
+                self._send(key)
+
+    def _send(self, key: BatchKey) -> None:
+        """Take the pending group for a key and send it in the background."""
+        items = self._pending.pop(key, None)
+        self._pending_bytes.pop(key, None)
+        if not items:
+            return
+
+        task = asyncio.create_task(self._translate_batch(key, items))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _translate_batch(
+        self, key: BatchKey, items: list[tuple[str, asyncio.Future]]
+    ) -> None:
+        """Translate one group and resolve each request's future."""
+        target_language, source_language = key
+        texts = [text for text, _ in items]
+        logger.debug(f"Sending batch of {len(texts)} → {target_language}")
+        try:
+            results = await self.translator.translate_batch(
+                texts, target_language, source_language
+            )
+        except Exception as e:
+            if len(items) == 1 or _is_service_failure(e):
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            # One bad text shouldn't fail (and get negatively cached for)
+            # every text in the batch: retry each text so failures are per text
+            logger.debug(f"Batch of {len(texts)} failed ({e!r}), retrying individually")
+            await asyncio.gather(
+                *(self._translate_one(key, text, future) for text, future in items)
+            )
+            return
+
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _translate_one(
+        self, key: BatchKey, text: str, future: asyncio.Future
+    ) -> None:
+        """Translate a single text outside a batch and resolve its future."""
+        target_language, source_language = key
+        try:
+            result = await self.translator.translate(
+                text, target_language, source_language
+            )
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
@@ -3,52 +3,147 @@ Translation cache module for the Translation cog.
 
 Provides in-memory caching with TTL (time-to-live) to reduce API calls and
 improve response latency. Uses an LRU (Least Recently Used) eviction policy
-to prevent unbounded memory growth in large servers.
+to prevent unbounded memory growth in large servers. Entries can optionally
+be persisted to an SQLite file so the cache survives cog reloads.
 
 No Discord imports allowed - this module is pure data structure logic.
 """
 
 import asyncio
-import hashlib
 import logging
+import math
+import sqlite3
+import sys
 import time
-from collections import OrderedDict
+from contextlib import closing
 from dataclasses import dataclass
-from typing import Optional
+from itertools import islice
+from pathlib import Path
+from typing import Awaitable, Callable, Optional, Union
+
+import xxhash
 
 logger = logging.getLogger(__name__)
+# Debug calls in this module pass %-style args instead of f-strings: they sit
+# on every get/set, and lazy args skip formatting when debug logging is off.
 
+# Bound once so hot paths skip the module attribute lookup
+_now = time.time
 
-@dataclass
+# Texts up to this many characters are used verbatim in cache keys; longer
+# texts are hashed. Below this a 16-byte digest saves no memory over the text.
+SHORT_TEXT_MAX = 16
+
+# Texts longer than this are never cached, so oversized input can't be used
+# to flood the cache or burn CPU hashing. Comfortably above a full Discord
+# message plus embed descriptions.
+MAX_TEXT_LENGTH = 8000
+
+CacheKey = tuple[str, Union[str, bytes]]
+"""A cache key: (target_language, text) or (target_language, text digest)."""
+
+
+@dataclass(frozen=True)
 class CacheEntry:
     """
     A single cached translation entry.
 
+    Entries are immutable and slotted (no per-instance __dict__), which keeps
+    a full cache noticeably smaller. __slots__ is declared by hand rather than
+    via dataclass(slots=True) to stay compatible with Python 3.9.
+
     Attributes:
         translated_text: The translated text
         source_language: Source language code that was detected/used
         target_language: Target language code requested
-        timestamp: Unix timestamp when entry was cached
-        ttl: Time-to-live in seconds (0 = no expiration)
+        expires_at: Unix timestamp after which the entry is stale
+                    (math.inf = no expiration)
+
+    A negative entry (empty translated_text) records a recent failure for the
+    text, so callers can skip re-hitting the API until it expires.
     """
 
+    __slots__ = (
+        "translated_text",
+        "source_language",
+        "target_language",
+        "expires_at",
+    )
+
     translated_text: str
     source_language: str
     target_language: str
-    timestamp: float
-    ttl: int
+    expires_at: float
 
-    def is_expired(self) -> bool:
+    @property
+    def is_negative(self) -> bool:
+        """True if this entry records a failed translation."""
+        return not self.translated_text
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """
         Check if this cache entry has expired.
 
+        Args:
+            now: Current Unix timestamp, or None to read the clock.
+                 Passing a cached timestamp avoids a clock read per check.
+
         Returns:
-            True if TTL has elapsed, False otherwise.
+            True if the expiry deadline has passed, False otherwise.
         """
-        if self.ttl <= 0:
-            return False
-        elapsed = time.time() - self.timestamp
-        return elapsed > self.ttl
+        if now is None:
+            now = _now()
+        return now > self.expires_at
+
+
+@dataclass
+class _Stats:
+    """
+    Hit/miss/eviction counters for a TranslationCache.
+
+    Kept in their own slotted object, apart from the cache's storage, so the
+    frequently bumped counters don't share an instance dict with it.
+
+    Attributes:
+        hits: Lookups that returned a live entry
+        misses: Lookups that found nothing or an expired entry
+        evictions: Entries removed to make room
+    """
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    hits: int
+    misses: int
+    evictions: int
+
+
+class _Shard:
+    """
+    One stripe of a TranslationCache.
+
+    Each shard owns an independent LRU-ordered mapping and its own lock, so
+    writers that land in different shards never wait on each other.
+
+    A plain dict is used for the mapping: dicts preserve insertion order, so
+    re-inserting a key marks it most-recently-used and the first key is the
+    LRU. This avoids OrderedDict's linked-list overhead per entry.
+
+    Attributes:
+        max_size: Maximum number of entries in this shard before LRU eviction
+    """
+
+    __slots__ = ("max_size", "entries", "lock")
+
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty shard.
+
+        Args:
+            max_size: Maximum number of entries held by this shard.
+        """
+        self.max_size = max_size
+        self.entries: dict[CacheKey, CacheEntry] = {}
+        self.lock = asyncio.Lock()
 
 
 class TranslationCache:
@@ -56,18 +151,55 @@ class TranslationCache:
     In-memory translation cache with LRU eviction and TTL support.
 
     This cache stores translations to avoid redundant API calls. It uses:
-    - **LRU eviction**: When max_size is reached, least-recently-used items are evicted
+    - **LRU eviction**: When max_size is reached, a batch of least-recently-used items is evicted
     - **TTL (time-to-live)**: Entries can expire after a set duration
-    - **Content hashing**: Uses SHA256 of input text as cache key for efficiency
-
-    Thread-safe for concurrent access via asyncio locks.
+    - **Content keys**: Keys on (language, text), hashing only very long text with xxHash
+    - **Lock striping**: Entries are spread over shards, each with its own lock
+
+    Safe for concurrent access from the event loop: reads are lock-free and
+    writes that may evict are serialized per shard with an asyncio lock. LRU
+    order and capacity are tracked per shard, so eviction is approximate
+    across the cache as a whole.
+
+    Freshness checks on reads use a coarse clock (refreshed every
+    CLOCK_INTERVAL seconds by start(), and on every write) rather than
+    reading the system clock per lookup. With TTLs measured in days the
+    sub-second skew is irrelevant.
+
+    If persist_path is given, start() loads previously saved entries and new
+    entries are written back every FLUSH_INTERVAL seconds and on stop().
+    Negative entries are never persisted, and neither are entries keyed by
+    raw text (see make_key()) or entries stored with persist=False, such as
+    text that needed no translation, so original message text never reaches
+    disk.
+    Persisted rows are deleted once they expire.
 
     Attributes:
         max_size: Maximum number of entries before LRU eviction
         default_ttl: Default TTL in seconds (0 = no expiration)
     """
 
-    def __init__(self, max_size: int = 5000, default_ttl: int = 604800):
+    CLOCK_INTERVAL = 0.1
+
+    EVICTION_FRACTION = 10
+    """A full shard evicts 1/EVICTION_FRACTION of its capacity at once."""
+
+    NEGATIVE_TTL = 60
+    """Default TTL in seconds for negative (failed translation) entries."""
+
+    UNTRANSLATED_TTL = 3600
+    """TTL in seconds for results that are the original text, see get_or_compute()."""
+
+    FLUSH_INTERVAL = 60
+    """Seconds between writes of new entries to persist_path."""
+
+    def __init__(
+        self,
+        max_size: int = 5000,
+        default_ttl: int = 604800,
+        num_shards: int = 16,
+        persist_path: Optional[Path] = None,
+    ):
         """
         Initialize the translation cache.
 
@@ -76,53 +208,362 @@ class TranslationCache:
                       When exceeded, least-recently-used entries are removed.
             default_ttl: Default time-to-live in seconds for entries.
                         Defaults to 604800 (7 days). Use 0 for no expiration.
+            num_shards: Number of lock stripes. Must be a power of two.
+                        Defaults to 16. Lowered to at most max_size, so
+                        every shard holds at least one entry.
+            persist_path: Optional SQLite file to persist entries to.
+                          Defaults to None (in-memory only).
+
+        Raises:
+            ValueError: If num_shards is not a positive power of two.
         """
+        if num_shards <= 0 or num_shards & (num_shards - 1):
+            raise ValueError("num_shards must be a positive power of two")
+
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = asyncio.Lock()
+        while num_shards > 1 and num_shards > max_size:
+            num_shards //= 2
+        self._shard_mask = num_shards - 1
+        # Spread the remainder so shard capacities add up to max_size
+        shard_size, remainder = divmod(max(1, max_size), num_shards)
+        self._shards = [
+            _Shard(shard_size + 1 if i < remainder else shard_size)
+            for i in range(num_shards)
+        ]
+
+        # Coarse clock used for expiry checks on the read path
+        self._now = _now()
+        self._clock_task: Optional[asyncio.Task] = None
+
+        # Pending computations for keys that missed, see get_or_compute()
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+
+        # Persistence: entries written since the last flush
+        self._persist_path = persist_path
+        self._dirty: dict[CacheKey, CacheEntry] = {}
+        self._flush_task: Optional[asyncio.Task] = None
 
         # Statistics tracking
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+        self._stats = _Stats(0, 0, 0)
+
+    async def start(self) -> None:
+        """
+        Load persisted entries and start background tasks.
+
+        Starts the task that keeps the coarse clock fresh and, if persistence
+        is enabled, the periodic flush task. Must be called from a running
+        event loop. Calling it again while the tasks are running has no effect.
+        """
+        if self._clock_task is None or self._clock_task.done():
+            self._clock_task = asyncio.create_task(self._run_clock())
+
+        if self._persist_path is not None and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            try:
+                await self._load()
+            except sqlite3.Error as e:
+                logger.warning("Could not load persisted cache: %s", e)
+            self._flush_task = asyncio.create_task(self._run_flush())
+
+    async def stop(self) -> None:
+        """Stop background tasks and flush pending entries to disk."""
+        for task in (self._clock_task, self._flush_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._clock_task = None
+        self._flush_task = None
+
+        if self._persist_path is not None:
+            await self.flush()
+
+    async def _run_clock(self) -> None:
+        """Refresh the coarse clock every CLOCK_INTERVAL seconds."""
+        while True:
+            self._now = _now()
+            await asyncio.sleep(self.CLOCK_INTERVAL)
+
+    async def _run_flush(self) -> None:
+        """Flush new entries to disk every FLUSH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            await self.flush()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the persistence database, creating the table if needed.
+
+        Only hashed keys are persisted, so text_key holds a digest.
+
+        The database uses write-ahead logging, so a flush appends to the log
+        instead of rewriting pages in place, and fsyncs only at checkpoints.
+
+        Returns:
+            An open sqlite3 connection. Caller is responsible for closing it.
+        """
+        self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._persist_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "target_language TEXT NOT NULL, "
+            "text_key BLOB NOT NULL, "
+            "translated_text TEXT NOT NULL, "
+            "source_language TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, "
+            "PRIMARY KEY (target_language, text_key))"
+        )
+        return conn
+
+    def _read_rows(self, now: float) -> list[tuple]:
+        """
+        Read the newest max_size unexpired rows, oldest first (blocking).
+
+        Older rows couldn't fit in memory anyway, so they are never read.
+        Expired rows are deleted first so they don't outlive their TTL on
+        disk just because nothing was written.
+        """
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            rows = conn.execute(
+                "SELECT target_language, text_key, translated_text, "
+                "source_language, expires_at FROM cache "
+                "WHERE expires_at > ? ORDER BY rowid DESC LIMIT ?",
+                (now, self.max_size),
+            ).fetchall()
+        rows.reverse()
+        return rows
+
+    def _write_rows(self, rows: list[tuple], now: float) -> None:
+        """
+        Upsert rows and prune expired or excess ones (blocking).
+
+        INSERT OR REPLACE gives rewritten rows a new rowid, so rowid order
+        tracks write recency and the oldest rows beyond max_size are dropped.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (target_language, text_key, "
+                "translated_text, source_language, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM cache WHERE rowid NOT IN "
+                "(SELECT rowid FROM cache ORDER BY rowid DESC LIMIT ?)",
+                (self.max_size,),
+            )
+
+    async def _load(self) -> None:
+        """Populate the shards from the persistence database."""
+        rows = await asyncio.to_thread(self._read_rows, _now())
+        for target_language, text_key, translated, source, expires_at in rows:
+            key = (target_language, text_key)
+            self._shard_for(key).entries[key] = CacheEntry(
+                translated_text=translated,
+                source_language=sys.intern(source),
+                target_language=sys.intern(target_language),
+                expires_at=expires_at,
+            )
+
+        # Rows arrive oldest first, so trimming from the front keeps the newest
+        for shard in self._shards:
+            excess = len(shard.entries) - shard.max_size
+            if excess > 0:
+                for key in list(islice(shard.entries, excess)):
+                    del shard.entries[key]
+        logger.debug("Cache loaded %d persisted entries", len(rows))
+
+    async def flush(self) -> None:
+        """
+        Write entries stored since the last flush to the persistence file.
+
+        Does nothing if persistence is disabled or nothing changed. Writes
+        run in a worker thread so the event loop is not blocked.
+        """
+        if self._persist_path is None or not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        rows = [
+            (key[0], key[1], e.translated_text, e.source_language, e.expires_at)
+            for key, e in dirty.items()
+        ]
+        try:
+            await asyncio.to_thread(self._write_rows, rows, _now())
+        except sqlite3.Error as e:
+            logger.warning("Could not persist cache: %s", e)
+            return
+        logger.debug("Cache flushed %d entries", len(rows))
 
     @staticmethod
-    def _make_key(text: str, target_language: str) -> str:
+    def make_key(text: str, target_language: str) -> CacheKey:
         """
         Generate a cache key from text and target language.
 
-        Uses SHA256 hashing to ensure deterministic, collision-resistant keys.
-        This avoids storing large text as dictionary keys.
+        Keys are (target_language, text) tuples. The dict hashes tuple keys in
+        C, and str objects memoize their own hash, so repeated lookups for the
+        same text cost no extra hashing and no key string has to be built.
+
+        Texts over SHORT_TEXT_MAX characters use a raw 16-byte XXH3-128 digest
+        of the text in place of the text itself, so the cache never retains
+        the original text of a typical message, and dict hashing/equality on
+        long keys compares 16 bytes instead of the whole string. A
+        non-cryptographic hash is sufficient since the cache is local; at
+        128 bits collisions are not a practical concern.
+
+        Callers doing a lookup followed by a store for the same text (the usual
+        miss-then-fill flow) should compute the key once and use
+        get_by_key()/set_by_key() so the text is only hashed once.
 
         Args:
             text: Original text
             target_language: Target language code
 
         Returns:
-            Cache key in format: "{target_lang}:{sha256_hash}"
+            (target_language, text) for short texts, or
+            (target_language, xxh3_128_digest) for long texts. The digest is
+            bytes and the text is str, so the two forms can never collide.
+
+        Examples:
+            >>> TranslationCache.make_key("Hello world", "es")
+            ('es', 'Hello world')
+            >>> lang, digest = TranslationCache.make_key("How is everyone?!", "es")
+            >>> lang, len(digest)
+            ('es', 16)
+        """
+        if len(text) <= SHORT_TEXT_MAX:
+            return (target_language, text)
+        return (target_language, xxhash.xxh3_128_digest(text.encode("utf-8")))
+
+    def _shard_for(self, key: CacheKey) -> _Shard:
+        """
+        Pick the shard responsible for a key.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The shard that stores (or would store) the key.
+        """
+        return self._shards[hash(key) & self._shard_mask]
+
+    @staticmethod
+    def is_cacheable(text: str) -> bool:
+        """
+        Check whether text is worth caching.
+
+        Empty or whitespace-only text and text over MAX_TEXT_LENGTH are
+        rejected before any hashing or locking happens.
+
+        Args:
+            text: Original text
+
+        Returns:
+            True if the text may be looked up or stored, False otherwise.
+        """
+        return bool(text) and len(text) <= MAX_TEXT_LENGTH and not text.isspace()
+
+    def peek(self, text: str, target_language: str) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached translation without awaiting.
+
+        Same lookup as get(), for hot paths that shouldn't suspend on a cache
+        hit. The cache is only used from one event loop and the lookup never
+        awaits, so no lock is needed.
+
+        Args:
+            text: Original text that was translated
+            target_language: Target language code
+
+        Returns:
+            CacheEntry if found and not expired, None otherwise (including
+            when the text is not cacheable, see is_cacheable()).
 
         Examples:
-            >>> key = TranslationCache._make_key("Hello world", "es")
-            >>> print(key)
-            'es:6b6b4b6c3d4e5f6g...'
+            >>> cached = cache.peek("Hola", "english")
+            >>> if cached:
+            ...     print(cached.translated_text)
+            ...     'Hello'
+        """
+        if not self.is_cacheable(text):
+            return None
+        return self.peek_by_key(self.make_key(text, target_language))
+
+    def peek_by_key(self, key: CacheKey) -> Optional[CacheEntry]:
         """
-        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        return f"{target_language}:{text_hash}"
+        Retrieve a cached translation by a precomputed key without awaiting.
+
+        Same semantics as peek(), but skips hashing the text.
+
+        Reads do not take the lock: each dict operation used here is
+        atomic and nothing awaits between them, so a hit never has to queue
+        behind writers. Shard locks only guard eviction in set_by_key().
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            CacheEntry if found and not expired, None otherwise.
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        logger.debug("Cache hit: %r", key)
+        return entry
+
+    def _lookup(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Look up a key like peek_by_key(), without counting a hit or miss.
+
+        Used for repeat lookups within one request, so each request is
+        counted once in the stats.
+        """
+        entries = self._shard_for(key).entries
+        entry = entries.get(key)
+        if entry is None:
+            return None
+
+        # Check expiration
+        if entry.is_expired(self._now):
+            logger.debug("Cache entry expired: %r", key)
+            entries.pop(key, None)
+            return None
+
+        # Mark as recently used (re-insert to move it to the end)
+        del entries[key]
+        entries[key] = entry
+        return entry
 
     async def get(self, text: str, target_language: str) -> Optional[CacheEntry]:
         """
         Retrieve a cached translation.
 
-        Marks the entry as recently-used for LRU purposes. If entry has expired,
-        removes it and returns None.
+        Async wrapper around peek() for callers that already await the
+        cache. Marks the entry as recently-used for LRU purposes. If entry
+        has expired, removes it and returns None.
 
         Args:
             text: Original text that was translated
             target_language: Target language code
 
         Returns:
-            CacheEntry if found and not expired, None otherwise.
+            CacheEntry if found and not expired, None otherwise (including
+            when the text is not cacheable, see is_cacheable()).
 
         Examples:
             >>> cached = await cache.get("Hola", "english")
@@ -130,27 +571,21 @@ class TranslationCache:
             ...     print(cached.translated_text)
             ...     'Hello'
         """
-        async with self._lock:
-            key = self._make_key(text, target_language)
+        return self.peek(text, target_language)
 
-            if key not in self._cache:
-                self._misses += 1
-                return None
+    async def get_by_key(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Retrieve a cached translation by a precomputed key.
 
-            entry = self._cache[key]
+        Async wrapper around peek_by_key().
 
-            # Check expiration
-            if entry.is_expired():
-                logger.debug(f"Cache entry expired: {key}")
-                del self._cache[key]
-                self._misses += 1
-                return None
+        Args:
+            key: Cache key from make_key()
 
-            # Mark as recently used (move to end in OrderedDict)
-            self._cache.move_to_end(key)
-            self._hits += 1
-            logger.debug(f"Cache hit: {key}")
-            return entry
+        Returns:
+            CacheEntry if found and not expired, None otherwise.
+        """
+        return self.peek_by_key(key)
 
     async def set(
         self,
@@ -163,7 +598,8 @@ class TranslationCache:
         """
         Store a translation in the cache.
 
-        If cache is at max capacity, evicts the least-recently-used entry.
+        If the key's shard is at capacity, evicts its least-recently-used entry.
+        Text that is not cacheable (see is_cacheable()) is ignored.
 
         Args:
             text: Original text
@@ -175,36 +611,263 @@ class TranslationCache:
         Examples:
             >>> await cache.set("Hola", "english", "Hello", source_language="es")
         """
-        async with self._lock:
-            key = self._make_key(text, target_language)
-            ttl_value = ttl if ttl is not None else self.default_ttl
-
-            # Evict LRU entry if at capacity
-            if len(self._cache) >= self.max_size:
-                evicted_key = next(iter(self._cache))
-                del self._cache[evicted_key]
-                self._evictions += 1
-                logger.debug(f"Cache eviction: {evicted_key}")
-
-            entry = CacheEntry(
-                translated_text=translated_text,
-                source_language=source_language,
-                target_language=target_language,
-                timestamp=time.time(),
-                ttl=ttl_value,
-            )
-            self._cache[key] = entry
-            logger.debug(f"Cache set: {key}")
+        if not self.is_cacheable(text):
+            return
+        await self.set_by_key(
+            self.make_key(text, target_language),
+            target_language,
+            translated_text,
+            source_language,
+            ttl,
+        )
+
+    async def set_by_key(
+        self,
+        key: CacheKey,
+        target_language: str,
+        translated_text: str,
+        source_language: str = "auto",
+        ttl: Optional[int] = None,
+        persist: bool = True,
+    ) -> CacheEntry:
+        """
+        Store a translation in the cache under a precomputed key.
+
+        Same semantics as set(), but skips hashing the text.
+
+        Args:
+            key: Cache key from make_key()
+            target_language: Target language code
+            translated_text: The translated result
+            source_language: Source language detected/used. Defaults to "auto".
+            ttl: Time-to-live in seconds, or None to use default.
+            persist: False to keep the entry in memory only, e.g. when
+                translated_text is the original text. Defaults to True.
+
+        Returns:
+            The stored CacheEntry.
+        """
+        ttl_value = ttl if ttl is not None else self.default_ttl
+        # Writes read the real clock and refresh the coarse one with it,
+        # so reads stay accurate even when start() was never called
+        self._now = now = _now()
+        # Language codes come from a small fixed set; interning them makes
+        # every entry share one string object per language
+        entry = CacheEntry(
+            translated_text=translated_text,
+            source_language=sys.intern(source_language),
+            target_language=sys.intern(target_language),
+            expires_at=now + ttl_value if ttl_value > 0 else math.inf,
+        )
+
+        # Only the evict-then-insert sequence needs the shard lock
+        shard = self._shard_for(key)
+        evicted = 0
+        async with shard.lock:
+            entries = shard.entries
+            # When the shard is full, evict a batch of LRU entries at once so
+            # most inserts are a plain dict store rather than evict + store
+            if len(entries) >= shard.max_size:
+                batch = max(1, shard.max_size // self.EVICTION_FRACTION)
+                for evicted_key in list(islice(entries, batch)):
+                    del entries[evicted_key]
+                evicted = batch
+            entries[key] = entry
+
+        # Raw-text keys would write the original message to disk; short
+        # texts are cheap to translate again, so they stay in memory only
+        if (
+            persist
+            and self._persist_path is not None
+            and not entry.is_negative
+            and isinstance(key[1], bytes)
+        ):
+            self._dirty[key] = entry
+
+        if evicted:
+            self._stats.evictions += evicted
+            logger.debug("Cache eviction: %d entries", evicted)
+        logger.debug("Cache set: %r", key)
+        return entry
+
+    async def get_or_compute(
+        self,
+        key: CacheKey,
+        target_language: str,
+        compute: Callable[[], Awaitable[str]],
+        source_language: str = "auto",
+        peeked: bool = False,
+        source_text: Optional[str] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for a key, computing and storing it on a miss.
+
+        Concurrent misses for the same key are coalesced: the first caller runs
+        compute() and every other caller awaits its result, so a burst of
+        identical requests costs a single upstream call. The in-flight entry
+        is always removed when compute() finishes, fails or is cancelled; if
+        it was cancelled, one of the waiters takes over the computation.
+
+        Negative entries are returned as-is; check CacheEntry.is_negative.
+
+        Each call counts as one hit or miss in the stats. Callers that
+        already missed with peek_by_key() pass peeked=True so the miss isn't
+        counted twice; nothing may be awaited between the two calls.
+
+        If compute() returns source_text unchanged (text already in the
+        target language, or with nothing to translate), the entry holds the
+        original text, so it is kept in memory only and never persisted. It
+        also expires after UNTRANSLATED_TTL, so a wrong guess that the text
+        needed no translation doesn't stick for the full default TTL.
+
+        Args:
+            key: Cache key from make_key()
+            target_language: Target language code
+            compute: Zero-argument coroutine function producing the translation
+            source_language: Source language detected/used. Defaults to "auto".
+            peeked: True if the caller just missed on this key with
+                peek_by_key(). Skips the initial lookup. Defaults to False.
+            source_text: The text being translated, used to spot results
+                that are the original text. Defaults to None.
+
+        Returns:
+            The cached or newly stored CacheEntry, or None if compute()
+            returned an empty result (which is not cached).
+
+        Raises:
+            Exception: Whatever compute() raised, for the caller that ran it
+                and for every caller waiting on it.
+
+        Examples:
+            >>> key = cache.make_key("Hola", "english")
+            >>> entry = await cache.get_or_compute(
+            ...     key, "english", lambda: translator.translate("Hola", "english")
+            ... )
+        """
+        if not peeked:
+            entry = self.peek_by_key(key)
+            if entry is not None:
+                return entry
+
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+
+            logger.debug("Cache joined in-flight: %r", key)
+            try:
+                # Shield so a cancelled waiter doesn't cancel the shared result
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    # This waiter itself was cancelled
+                    raise
+                # The caller running compute() was cancelled; rather than
+                # failing every waiter with it, retry and take over if needed
+                entry = self._lookup(key)
+                if entry is not None:
+                    return entry
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            translated = await compute()
+            entry = None
+            if translated:
+                if translated.strip() == (source_text or "").strip():
+                    entry = await self.set_by_key(
+                        key,
+                        target_language,
+                        translated,
+                        source_language,
+                        self.UNTRANSLATED_TTL,
+                        persist=False,
+                    )
+                else:
+                    entry = await self.set_by_key(
+                        key, target_language, translated, source_language
+                    )
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so a failure with no waiters isn't logged
+                future.exception()
+            raise
+        else:
+            future.set_result(entry)
+            return entry
+        finally:
+            self._inflight.pop(key, None)
+
+    async def set_negative(
+        self,
+        text: str,
+        target_language: str,
+        reason: str,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Record that translating text failed, so repeats can skip the API.
+
+        Stores a negative entry (see CacheEntry.is_negative) with a short TTL.
+        A later successful set() for the same text replaces it.
+
+        Args:
+            text: Original text
+            target_language: Target language code
+            reason: Short description of the failure, for logging
+            ttl: Time-to-live in seconds, or None to use NEGATIVE_TTL.
+
+        Examples:
+            >>> await cache.set_negative("Hola", "english", "rate limited")
+        """
+        if not self.is_cacheable(text):
+            return
+        await self.set_negative_by_key(
+            self.make_key(text, target_language), target_language, reason, ttl
+        )
+
+    async def set_negative_by_key(
+        self,
+        key: CacheKey,
+        target_language: str,
+        reason: str,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Record a failed translation under a precomputed key.
+
+        Same semantics as set_negative(), but skips hashing the text.
+
+        Args:
+            key: Cache key from make_key()
+            target_language: Target language code
+            reason: Short description of the failure, for logging
+            ttl: Time-to-live in seconds, or None to use NEGATIVE_TTL.
+        """
+        logger.debug("Cache negative set: %r (%s)", key, reason)
+        await self.set_by_key(
+            key,
+            target_language,
+            "",
+            "",
+            ttl if ttl is not None else self.NEGATIVE_TTL,
+        )
 
     async def clear(self) -> None:
         """
         Clear all entries from the cache.
 
         Useful for cleanup on cog unload or memory pressure situations.
+        Already persisted entries are kept on disk; call stop() first to
+        flush pending ones.
         """
-        async with self._lock:
-            self._cache.clear()
-            logger.debug("Cache cleared")
+        for shard in self._shards:
+            async with shard.lock:
+                shard.entries.clear()
+        logger.debug("Cache cleared")
 
     async def cleanup_expired(self) -> int:
         """
@@ -215,21 +878,32 @@ class TranslationCache:
         Returns:
             Number of entries removed
         """
-        async with self._lock:
-            before = len(self._cache)
-            self._cache = OrderedDict(
-                (k, v) for k, v in self._cache.items() if not v.is_expired()
-            )
-            after = len(self._cache)
-            removed = before - after
-            if removed > 0:
-                logger.debug(f"Cache cleanup: removed {removed} expired entries")
-            return removed
+        removed = 0
+        now = _now()
+        for shard in self._shards:
+            async with shard.lock:
+                # Delete in place rather than rebuilding the dict, so a sweep
+                # that finds few expired entries copies nothing. Expiry is
+                # inlined against a single timestamp to skip a method call and
+                # clock read per entry.
+                entries = shard.entries
+                expired = [k for k, v in entries.items() if now > v.expires_at]
+                for k in expired:
+                    del entries[k]
+                removed += len(expired)
+        if removed > 0:
+            logger.debug("Cache cleanup: removed %d expired entries", removed)
+        return removed
 
     def get_stats(self) -> dict:
         """
         Get cache statistics.
 
+        Counters are best-effort metrics: they are updated outside any lock,
+        so a snapshot taken while requests are in flight may be slightly
+        behind. Each counter is read once, so hit_rate always agrees with the
+        reported hits and misses.
+
         Returns:
             Dictionary with cache hit/miss statistics and size info.
             Example:
@@ -242,20 +916,21 @@ class TranslationCache:
                     'evictions': 5
                 }
         """
-        total_requests = self._hits + self._misses
-        hit_rate = self._hits / total_requests if total_requests > 0 else 0
+        stats = self._stats
+        hits = stats.hits
+        misses = stats.misses
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0
 
         return {
-            "size": len(self._cache),
+            "size": sum(len(shard.entries) for shard in self._shards),
             "max_size": self.max_size,
-            "hits": self._hits,
-            "misses": self._misses,
+            "hits": hits,
+            "misses": misses,
             "hit_rate": hit_rate,
-            "evictions": self._evictions,
+            "evictions": stats.evictions,
         }
 
     def reset_stats(self) -> None:
         """Reset cache statistics (hits, misses, evictions)."""
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+        self._stats = _Stats(0, 0, 0)
@@ -12,16 +12,23 @@ Provides:
 - Ephemeral response system (translations only visible to requester)
 """
 
+import asyncio
+import heapq
 import logging
 import re
+import time
+from bisect import bisect_left
+from collections import OrderedDict
 from typing import Optional, Union
 
 import discord
 from redbot.core import commands, app_commands, Config
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 
 from .translator import Translator, TranslationAPIError, LanguageNotFoundError
 from .cache import TranslationCache
+from .batch import BatchQueue
 from . import strings
 
 logger = logging.getLogger(__name__)
@@ -29,10 +36,117 @@ logger = logging.getLogger(__name__)
 # Matches Discord custom emojis: <:name:id> or <a:name:id>
 CUSTOM_EMOJI_PATTERN = re.compile(r"<a?:\w+:\d+>")
 
+# Autocomplete runs on every keystroke, so invariant work is done once here.
+# Deduplicated: googletrans lists some names under two codes (e.g. hebrew).
+SORTED_LANGUAGES = sorted(set(Translator.LANGUAGE_CODES.values()))
+LANGUAGE_CHOICES = {
+    lang: app_commands.Choice(name=lang.title(), value=lang)
+    for lang in SORTED_LANGUAGES
+}
+DEFAULT_LANGUAGE_CHOICES = [LANGUAGE_CHOICES[lang] for lang in SORTED_LANGUAGES[:25]]
+# Every suffix of every casefolded language name with its offset, sorted, so
+# prefix and substring matches are both found by binary search (a substring
+# is a prefix of some suffix; offset 0 is a prefix match). Folding happens
+# once here instead of per language on every keystroke.
+LANGUAGE_INDEX = sorted(
+    (folded[i:], i, lang)
+    for lang in SORTED_LANGUAGES
+    for folded in (lang.casefold(),)
+    for i in range(len(folded))
+)
+
+
+# Common English function words, used to spot text that's already English.
+# Short words that are also common in other languages ("a", "no", "me", "in",
+# "on", "so", ...) are left out, since they prove nothing.
+ENGLISH_STOPWORDS = frozenset(
+    "about and are but can from have it's just not that the their there they "
+    "this was what when where which will with would you your".split()
+)
+# Common Spanish, French, Portuguese, Italian and German function words that
+# aren't English words. Any of them means the text gets translated.
+FOREIGN_STOPWORDS = frozenset(
+    "de del el en es est et ich ist je la las les los mit muy nicht nous pas "
+    "pero por que qui se sie und una une vous y".split()
+)
+ENGLISH_WORD_PATTERN = re.compile(r"[a-z']+")
+ENGLISH_TARGETS = frozenset({"en", "english"})
+
+
+def _probably_english(text: str) -> bool:
+    """
+    Cheaply guess whether text is already English.
+
+    Deliberately conservative, since a false positive means the user gets
+    their text back untranslated: the text must be pure ASCII, mostly
+    letters, have at least three words, at least two words and a third of
+    all words must be distinctly English function words, and no word may be
+    a common function word of another language. Unaccented Spanish or French
+    ("no me gusta la playa") fails these tests and still gets translated.
+
+    Args:
+        text: Cleaned text to check
+
+    Returns:
+        True if the text is very likely English, False if unsure.
+    """
+    if not text.isascii():
+        return False
+
+    non_space = sum(1 for ch in text if not ch.isspace())
+    letters = sum(1 for ch in text if ch.isalpha())
+    if not non_space or letters / non_space < 0.8:
+        return False
+
+    words = ENGLISH_WORD_PATTERN.findall(text.lower())
+    if len(words) < 3:
+        return False
+    if not FOREIGN_STOPWORDS.isdisjoint(words):
+        return False
+    common = sum(1 for word in words if word in ENGLISH_STOPWORDS)
+    return common >= 2 and common * 3 >= len(words)
+
+
+def _match_languages(current: str, limit: int = 25) -> list[str]:
+    """
+    Find languages matching typed input, best matches first.
+
+    Candidates are gathered by binary-searching the suffix index and walking
+    only the matching run, so the cost tracks the number of matches rather
+    than the number of languages. They are then ranked by match position
+    (prefix matches first), then by name length (closer to what was typed),
+    then alphabetically. Each candidate's sort key is computed once and heapq
+    keeps only the top `limit`, avoiding a full sort.
+
+    Args:
+        current: Casefolded, stripped user input (non-empty)
+        limit: Maximum number of results
+
+    Returns:
+        Up to `limit` matching language names, best match first.
+    """
+    # language -> earliest match position
+    positions: dict[str, int] = {}
+    i = bisect_left(LANGUAGE_INDEX, (current,))
+    while i < len(LANGUAGE_INDEX) and LANGUAGE_INDEX[i][0].startswith(current):
+        _, offset, lang = LANGUAGE_INDEX[i]
+        if offset < positions.get(lang, offset + 1):
+            positions[lang] = offset
+        i += 1
+
+    return heapq.nsmallest(
+        limit, positions, key=lambda lang: (positions[lang], len(lang), lang)
+    )
+
 
 class Translation(commands.Cog):
     """Translate messages using Google Translate. Supports slash commands and context menus."""
 
+    # In-memory preferred-language cache: seconds before re-reading Config,
+    # and maximum number of users kept
+    PREF_TTL = 300
+    PREF_CACHE_SIZE = 1000
+
     def __init__(self, bot: Red):
         """
         Initialize the Translation cog.
@@ -43,9 +157,15 @@ class Translation(commands.Cog):
         self.bot = bot
         self.logger = logging.getLogger("red.unicornia-cogs.translate")
 
-        # Initialize translator and cache
+        # Initialize translator, request batching and cache
         self.translator = Translator(timeout=10)
-        self.cache = TranslationCache(max_size=5000, default_ttl=604800)  # 7 days
+        self.batch_queue = BatchQueue(self.translator)
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self.cache = TranslationCache(
+            max_size=5000,
+            default_ttl=604800,  # 7 days
+            persist_path=cog_data_path(self) / "translation_cache.sqlite3",
+        )
 
         # Initialize config
         self.config = Config.get_conf(
@@ -53,21 +173,42 @@ class Translation(commands.Cog):
         )
         self.config.register_user(preferred_language="english")
 
+        # user_id -> (preferred_language, cached_at), LRU ordered
+        self._pref_lang_cache: OrderedDict[int, tuple[str, float]] = OrderedDict()
+
         # Add context menu command
         self.context_menu = app_commands.ContextMenu(
             name="Translate", callback=self.translate_context_menu
         )
         self.bot.tree.add_command(self.context_menu)
 
+    async def cog_load(self):
+        """
+        Start background tasks when the cog is loaded.
+
+        Loads the persisted translation cache and starts its background tasks,
+        starts the request batching queue, and opens the translator's
+        connection in the background so the first request doesn't wait on it.
+        """
+        await self.cache.start()
+        self.batch_queue.start()
+        self._warm_up_task = asyncio.create_task(self.translator.warm_up())
+
     async def cog_unload(self):
         """
         Clean up when cog is unloaded.
 
-        Removes context menu and clears cache.
+        Removes context menu, drains the batching queue, closes the
+        translator's connections, flushes the cache to disk and clears it.
         """
         self.bot.tree.remove_command(
             self.context_menu.name, type=self.context_menu.type
         )
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+        await self.batch_queue.stop()
+        await self.translator.close()
+        await self.cache.stop()
         await self.cache.clear()
         self.logger.info("Translation cog unloaded")
 
@@ -75,11 +216,16 @@ class Translation(commands.Cog):
         """
         Delete user data when requested (GDPR compliance).
 
+        Only the language preference is tied to a user. The on-disk
+        translation cache stores no original text or author, so its entries
+        can't be matched to a user; they are deleted when they expire.
+
         Args:
             requester: The request source (who is requesting deletion)
             user_id: The user ID to delete data for
         """
         await self.config.user_from_id(user_id).clear()
+        self._pref_lang_cache.pop(user_id, None)
 
     # ========================================================================
     # AUTOCOMPLETE CALLBACKS (must be before decorators that reference them)
@@ -101,33 +247,14 @@ class Translation(commands.Cog):
         Returns:
             List of language choices (max 25)
         """
-        available_langs = list(Translator.LANGUAGE_CODES.values())
-        available_langs.sort()
-        current = current.strip().lower()
+        current = current.strip().casefold()
 
         if not current:
             # Show first 25 languages
-            return [
-                app_commands.Choice(name=lang.title(), value=lang)
-                for lang in available_langs[:25]
-            ]
-
-        # Prioritize languages that start with the current input
-        choices = []
-        remaining = available_langs.copy()
+            return DEFAULT_LANGUAGE_CHOICES
 
-        # Starting matches first
-        for lang in available_langs:
-            if lang.lower().startswith(current):
-                choices.append(app_commands.Choice(name=lang.title(), value=lang))
-                remaining.remove(lang)
-
-        # Then partial matches
-        for lang in remaining:
-            if current in lang.lower():
-                choices.append(app_commands.Choice(name=lang.title(), value=lang))
-
-        return choices[:25]
+        # Prefix matches first, then partial matches, best first
+        return [LANGUAGE_CHOICES[lang] for lang in _match_languages(current)]
 
     # ========================================================================
     # HELPER METHODS
@@ -146,9 +273,57 @@ class Translation(commands.Cog):
         Returns:
             Cleaned text ready for translation
         """
+        # Most messages have no custom emojis; plain substring scans rule
+        # them out without running the regex at all
+        if "<:" not in text and "<a:" not in text:
+            return text.strip()
         # Remove Discord custom emojis
-        cleaned = CUSTOM_EMOJI_PATTERN.sub("", text)
-        return cleaned.strip()
+        return CUSTOM_EMOJI_PATTERN.sub("", text).strip()
+
+    @staticmethod
+    def _gather_message_content(message: discord.Message) -> str:
+        """
+        Collect the translatable text of a message.
+
+        Joins the message content with any embed descriptions, one per line.
+
+        Args:
+            message: Message to read
+
+        Returns:
+            Message content followed by embed descriptions
+        """
+        parts = [message.content]
+        parts.extend(e.description for e in message.embeds if e.description)
+        return "\n".join(parts)
+
+    async def _resolve_source_content(
+        self, ctx: commands.Context
+    ) -> tuple[discord.Message, str]:
+        """
+        Get the message the command replied to, and its translatable text.
+
+        Uses the message already attached to the reply, or discord.py's
+        in-memory message cache, before falling back to fetching it over
+        REST, so replies to recent messages cost no extra HTTP request.
+
+        Args:
+            ctx: Command context whose message is a reply
+
+        Returns:
+            (referenced message, its content including embed descriptions)
+
+        Raises:
+            discord.NotFound: If the referenced message no longer exists
+            discord.Forbidden: If the bot cannot read the referenced message
+        """
+        reference = ctx.message.reference
+        source_message = reference.resolved
+        if not isinstance(source_message, discord.Message):
+            source_message = reference.cached_message
+        if source_message is None:
+            source_message = await ctx.channel.fetch_message(reference.message_id)
+        return source_message, self._gather_message_content(source_message)
 
     async def _respond_ephemeral(
         self,
@@ -184,6 +359,35 @@ class Translation(commands.Cog):
                     # Fallback to regular message if ephemeral fails
                     await ctx.send(embed=embed)
 
+    async def _get_preferred_language(
+        self, user: Union[discord.User, discord.Member]
+    ) -> Optional[str]:
+        """
+        Get a user's preferred language, served from memory when fresh.
+
+        Avoids a Config read on every translate for repeat users. Entries are
+        refreshed after PREF_TTL seconds and the least recently used users are
+        dropped past PREF_CACHE_SIZE.
+
+        Args:
+            user: The user to look up
+
+        Returns:
+            The user's preferred language, or None if unset.
+        """
+        now = time.monotonic()
+        cached = self._pref_lang_cache.get(user.id)
+        if cached is not None and now - cached[1] < self.PREF_TTL:
+            self._pref_lang_cache.move_to_end(user.id)
+            return cached[0]
+
+        language = await self.config.user(user).preferred_language()
+        self._pref_lang_cache[user.id] = (language, now)
+        self._pref_lang_cache.move_to_end(user.id)
+        if len(self._pref_lang_cache) > self.PREF_CACHE_SIZE:
+            self._pref_lang_cache.popitem(last=False)
+        return language
+
     # ========================================================================
     # TRANSLATION LOGIC
     # ========================================================================
@@ -217,21 +421,50 @@ class Translation(commands.Cog):
         if not text:
             return None
 
-        # Check cache first
-        cached = await self.cache.get(text, target_language)
-        if cached:
-            self.logger.debug(f"Cache hit: {text[:50]}... → {target_language}")
-            return cached.translated_text
-
-        # Not in cache - translate via API
-        translated = await self.translator.translate(
-            text, target_language, source_language
-        )
+        # Oversized text skips the cache entirely
+        if not self.cache.is_cacheable(text):
+            return await self.translator.translate(
+                text, target_language, source_language
+            )
 
-        # Cache the result
-        await self.cache.set(text, target_language, translated, source_language)
+        # Key once; concurrent requests for the same text share one API call
+        cache_key = self.cache.make_key(text, target_language)
 
-        return translated
+        async def fetch() -> str:
+            # Already in the target language: no API call, and the
+            # identity result is cached (in memory, briefly) so repeats are
+            # a plain cache hit
+            if target_language in ENGLISH_TARGETS and _probably_english(text):
+                self.logger.debug("Skipping translation of English text to English")
+                return text
+            try:
+                # Batched with other requests for the same language pair
+                return await self.batch_queue.submit(
+                    text, target_language, source_language
+                )
+            except (TranslationAPIError, asyncio.TimeoutError) as e:
+                await self.cache.set_negative_by_key(
+                    cache_key, target_language, type(e).__name__
+                )
+                raise
+
+        # Sync lookup first: a hit returns without suspending the coroutine
+        entry = self.cache.peek_by_key(cache_key)
+        if entry is None:
+            entry = await self.cache.get_or_compute(
+                cache_key,
+                target_language,
+                fetch,
+                source_language,
+                peeked=True,
+                source_text=text,
+            )
+        if entry is None:
+            return None
+        if entry.is_negative:
+            # Failed recently - don't hammer the API while it's unhappy
+            raise TranslationAPIError("Translation failed recently; not retrying")
+        return entry.translated_text
 
     # ========================================================================
     # COMMANDS - PREFIX TEXT COMMANDS
@@ -252,7 +485,7 @@ class Translation(commands.Cog):
         """
         try:
             # Get user's preferred language
-            preferred_lang = await self.config.user(ctx.author).preferred_language()
+            preferred_lang = await self._get_preferred_language(ctx.author)
             if not preferred_lang:
                 await ctx.send(strings.NO_LANGUAGE_PREFERENCE, ephemeral=True)
                 return
@@ -265,14 +498,9 @@ class Translation(commands.Cog):
             elif ctx.message.reference:
                 # User replied to a message
                 try:
-                    source_message = await ctx.channel.fetch_message(
-                        ctx.message.reference.message_id
+                    source_message, content = await self._resolve_source_content(
+                        ctx
                     )
-                    content = source_message.content
-                    # Also include embed descriptions if present
-                    for embed in source_message.embeds:
-                        if embed.description:
-                            content += "\n" + embed.description
                 except (discord.NotFound, discord.Forbidden):
                     await ctx.send(strings.MISSING_MESSAGE, ephemeral=True)
                     return
@@ -282,7 +510,11 @@ class Translation(commands.Cog):
 
             # Translate
             try:
-                translated = await self._do_translate(content, preferred_lang)
+                # Color lookup (Config) overlaps the translation call
+                translated, color = await asyncio.gather(
+                    self._do_translate(content, preferred_lang),
+                    self.bot.get_embed_color(ctx.channel),
+                )
                 if not translated:
                     await ctx.send(strings.MISSING_MESSAGE, ephemeral=True)
                     return
@@ -293,7 +525,7 @@ class Translation(commands.Cog):
                     "original",  # Would need detected language from translator
                     preferred_lang,
                     original_author=source_message.author if source_message else None,
-                    color=await self.bot.get_embed_color(ctx.channel),
+                    color=color,
                 )
                 await self._respond_ephemeral(ctx, embed, source_message)
 
@@ -334,13 +566,9 @@ class Translation(commands.Cog):
                 content = text
             elif ctx.message.reference:
                 try:
-                    source_message = await ctx.channel.fetch_message(
-                        ctx.message.reference.message_id
+                    source_message, content = await self._resolve_source_content(
+                        ctx
                     )
-                    content = source_message.content
-                    for embed in source_message.embeds:
-                        if embed.description:
-                            content += "\n" + embed.description
                 except (discord.NotFound, discord.Forbidden):
                     await ctx.send(strings.MISSING_MESSAGE, ephemeral=True)
                     return
@@ -350,7 +578,11 @@ class Translation(commands.Cog):
 
             # Translate
             try:
-                translated = await self._do_translate(content, target_lang)
+                # Color lookup (Config) overlaps the translation call
+                translated, color = await asyncio.gather(
+                    self._do_translate(content, target_lang),
+                    self.bot.get_embed_color(ctx.channel),
+                )
                 if not translated:
                     await ctx.send(strings.MISSING_MESSAGE, ephemeral=True)
                     return
@@ -360,7 +592,7 @@ class Translation(commands.Cog):
                     "original",
                     target_lang,
                     original_author=source_message.author if source_message else None,
-                    color=await self.bot.get_embed_color(ctx.channel),
+                    color=color,
                 )
                 await self._respond_ephemeral(ctx, embed, source_message)
 
@@ -396,6 +628,7 @@ class Translation(commands.Cog):
 
         # Save preference
         await self.config.user(ctx.author).preferred_language.set(target_lang)
+        self._pref_lang_cache.pop(ctx.author.id, None)
 
         # Respond with success message in target language
         try:
@@ -439,7 +672,11 @@ class Translation(commands.Cog):
 
             # Translate
             try:
-                translated = await self._do_translate(text, target_lang)
+                # Color lookup (Config) overlaps the translation call
+                translated, color = await asyncio.gather(
+                    self._do_translate(text, target_lang),
+                    self.bot.get_embed_color(interaction.guild),
+                )
                 if not translated:
                     await interaction.followup.send(
                         strings.MISSING_MESSAGE, ephemeral=True
@@ -451,7 +688,7 @@ class Translation(commands.Cog):
                     "original",
                     target_lang,
                     original_author=interaction.user,
-                    color=await self.bot.get_embed_color(interaction.guild),
+                    color=color,
                 )
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -481,23 +718,22 @@ class Translation(commands.Cog):
 
         try:
             # Get user's preferred language
-            preferred_lang = await self.config.user(
-                interaction.user
-            ).preferred_language()
+            preferred_lang = await self._get_preferred_language(interaction.user)
             if not preferred_lang:
                 embed = strings.build_error_embed(strings.NO_LANGUAGE_PREFERENCE)
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
 
             # Get message content
-            content = message.content
-            for embed in message.embeds:
-                if embed.description:
-                    content += "\n" + embed.description
+            content = self._gather_message_content(message)
 
             # Translate
             try:
-                translated = await self._do_translate(content, preferred_lang)
+                # Color lookup (Config) overlaps the translation call
+                translated, color = await asyncio.gather(
+                    self._do_translate(content, preferred_lang),
+                    self.bot.get_embed_color(interaction.channel),
+                )
                 if not translated:
                     await interaction.followup.send(
                         strings.MISSING_MESSAGE, ephemeral=True
@@ -509,7 +745,7 @@ class Translation(commands.Cog):
                     "original",
                     preferred_lang,
                     original_author=message.author,
-                    color=await self.bot.get_embed_color(interaction.channel),
+                    color=color,
                 )
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
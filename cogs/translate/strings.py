@@ -57,6 +57,27 @@ LANGUAGE_SET_FOOTER = (
 # EMBED BUILDERS (return discord.Embed objects)
 # ============================================================================
 
+_LANG_TITLE_CACHE: dict[str, str] = {}
+"""Title-cased language names, filled on first use of each language."""
+
+
+def _title(language: str) -> str:
+    """
+    Return a language name in title case, memoized.
+
+    The set of language names is small and fixed, so each is title-cased once.
+
+    Args:
+        language: Language name (e.g., "spanish")
+
+    Returns:
+        Title-cased name (e.g., "Spanish")
+    """
+    title = _LANG_TITLE_CACHE.get(language)
+    if title is None:
+        title = _LANG_TITLE_CACHE[language] = language.title()
+    return title
+
 
 def build_translation_embed(
     translated_text: str,
@@ -103,9 +124,7 @@ def build_translation_embed(
         )
 
     # Footer shows language direction
-    source_title = source_language.title()
-    target_title = target_language.title()
-    embed.set_footer(text=f"{source_title} → {target_title}")
+    embed.set_footer(text=f"{_title(source_language)} → {_title(target_language)}")
 
     return embed
 
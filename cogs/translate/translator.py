@@ -10,13 +10,191 @@ No Discord imports allowed - this module is pure business logic.
 """
 
 import asyncio
+import functools
+import json
 import logging
-from typing import Optional
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Hashable, Iterator, Mapping, Optional
+from urllib.parse import quote_plus
+
 import googletrans
-from googletrans.models import Translated
+import httpx
+
+try:
+    import gcld3
+except ImportError:  # optional: without it, same-language text is sent to the API
+    gcld3 = None
 
 logger = logging.getLogger(__name__)
 
+# Failures expected from a flaky or rate-limiting API (network errors, HTTP
+# 4xx/5xx, truncated responses). Logged without a traceback, which would
+# only add cost when they come in bursts.
+_TRANSIENT_ERRORS = (httpx.HTTPError, json.JSONDecodeError)
+
+# Text with no letters at all (digits, punctuation, symbols, emoji): there is
+# nothing to translate or detect
+_TRIVIAL = re.compile(r"[\W\d_]+")
+
+# Every valid language code; the one place "is this a code?" is answered
+_VALID_CODES = frozenset(googletrans.LANGUAGES)
+
+# Language name -> code, for normalize_language(). Built once in dict order
+# with setdefault so a name listed twice keeps its first code, as the
+# original linear scan did. Chinese variants map to Simplified Chinese.
+_NAME_TO_CODE: dict[str, str] = {}
+for _code, _name in googletrans.LANGUAGES.items():
+    _name = _name.lower()
+    _NAME_TO_CODE.setdefault(
+        _name, "chinese (simplified)" if "chinese" in _name else _code
+    )
+del _code, _name
+
+# Shorthands that normalize to Simplified Chinese without being a language
+# name or code googletrans knows (anything mentioning "chinese" also does)
+_CHINESE_TRIGGERS = frozenset({"zh", "ch"})
+
+
+_local_detector = None
+
+
+def _detect_locally(text: str) -> Optional[str]:
+    """
+    Detect the language of text offline with CLD3, if it's installed.
+
+    Returns:
+        Language code when CLD3 is available and its result is reliable,
+        None otherwise.
+    """
+    global _local_detector
+    if gcld3 is None:
+        return None
+    if _local_detector is None:
+        _local_detector = gcld3.NNetLanguageIdentifier(
+            min_num_bytes=0, max_num_bytes=1000
+        )
+    result = _local_detector.FindLanguage(text=text)
+    return result.language if result.is_reliable else None
+
+
+# Boundaries to split long text on, tried in turn for a piece that is still
+# too long: sentence ends (CJK ones needn't be followed by whitespace), line
+# breaks, then any whitespace. Each pattern matches a piece
+# up to and including its boundary, or up to the end of the text.
+_BOUNDARIES = (
+    re.compile(r".+?(?:[.!?]+\s+|[。！？]+\s*|\Z)", re.DOTALL),
+    re.compile(r".+?(?:\n+|\Z)", re.DOTALL),
+    re.compile(r".+?(?:\s+|\Z)", re.DOTALL),
+)
+
+
+def _encoded_size(text: str) -> int:
+    """
+    Size of text once URL-encoded into the request's query string.
+
+    Non-ASCII characters take three bytes per UTF-8 byte, so this is what
+    counts against the API's URL length limit, not the text's own length.
+    """
+    return len(quote_plus(text))
+
+
+def _pieces(text: str, max_size: int, level: int = 0) -> Iterator[tuple[str, int]]:
+    """
+    Cut text on _BOUNDARIES[level] into (piece, encoded size) pairs.
+
+    Pieces over max_size are cut again on the next boundary; past the last
+    one, they are cut between characters.
+    """
+    if level == len(_BOUNDARIES):
+        for char in text:
+            yield char, _encoded_size(char)
+        return
+    for piece in _BOUNDARIES[level].findall(text):
+        size = _encoded_size(piece)
+        if size > max_size:
+            yield from _pieces(piece, max_size, level + 1)
+        else:
+            yield piece, size
+
+
+def _split_text(text: str, max_size: int) -> list[str]:
+    """
+    Split text into chunks whose URL-encoded size is at most max_size.
+
+    Text is cut on sentence boundaries where possible, and the pieces are
+    packed greedily. A sentence that is too long on its own is cut at line
+    breaks, then whitespace, then between characters. Each chunk keeps the
+    whitespace that followed it, so joining the chunks gives back the
+    original text.
+
+    Args:
+        text: Text to split
+        max_size: Maximum URL-encoded size of a chunk, see _encoded_size()
+
+    Returns:
+        Chunks of text, in order.
+    """
+    chunks = []
+    current = ""
+    current_size = 0
+    for piece, size in _pieces(text, max_size):
+        if current and current_size + size > max_size:
+            chunks.append(current)
+            current, current_size = "", 0
+        current += piece
+        current_size += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _inflight_done(inflight: dict, key: Hashable, task: asyncio.Task) -> None:
+    """
+    Done-callback for a shared in-flight task: forget it, mark errors seen.
+
+    Callers await the task through shield(), so if they were all cancelled
+    nobody retrieves a failure; retrieving it here stops asyncio logging
+    "Task exception was never retrieved". Callers still awaiting get the
+    exception as usual.
+    """
+    inflight.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+def _api_code(language: str) -> str:
+    """
+    Convert a normalized language to the code the API expects.
+
+    normalize_language() returns codes, except for Chinese which it returns
+    by name ("chinese (simplified)"); map names back to their codes.
+    """
+    return googletrans.LANGCODES.get(language, language)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_language(language: str) -> Optional[str]:
+    """Memoized implementation of Translator.normalize_language()."""
+    language_lower = language.lower().strip()
+
+    # Try direct code lookup first (e.g., "en" → "english")
+    if language_lower in _VALID_CODES:
+        return language_lower
+
+    # Try reverse lookup (e.g., "english" → "en"); Chinese variants
+    # already map to Simplified Chinese
+    code = _NAME_TO_CODE.get(language_lower)
+    if code is not None:
+        return code
+
+    # Chinese variations: shorthands, or any mention of "chinese"
+    if language_lower in _CHINESE_TRIGGERS or "chinese" in language_lower:
+        return "chinese (simplified)"
+
+    return None
+
 
 class TranslatorError(Exception):
     """Base exception for translation-related errors."""
@@ -36,31 +214,177 @@ class TranslationAPIError(TranslatorError):
     pass
 
 
+class DetectionResult(dict):
+    """
+    Result of language detection.
+
+    A dict with 'code', 'name' and 'confidence' keys, also readable as
+    attributes. Instances are shared with the detection cache, so treat
+    them as read-only; copy with dict() to modify.
+    """
+
+    __slots__ = ()
+
+    @property
+    def code(self) -> str:
+        """Detected language code (e.g., 'es')."""
+        return self["code"]
+
+    @property
+    def name(self) -> str:
+        """Detected language name (e.g., 'spanish')."""
+        return self["name"]
+
+    @property
+    def confidence(self) -> float:
+        """Detection confidence between 0 and 1."""
+        return self["confidence"]
+
+
 class Translator:
     """
     Handle translation operations using Google Translate.
 
     This class provides methods for translating text and detecting languages.
-    All operations are async-safe but delegate to Google Translate's synchronous
-    API via asyncio.to_thread() to avoid blocking the event loop.
+    Requests go straight to Google Translate's public endpoint over one async
+    HTTP/2 client, so concurrent calls share a connection and no threads are
+    involved.
 
     Attributes:
-        _translator: Internal googletrans.Translator instance
+        _http: Async HTTP client used for all API calls
         _timeout: Maximum seconds to wait for a translation request
+        _skip_same_language: Return text unchanged when a local detector
+            finds it is already in the target language
+        _semaphore: Bounds concurrent API calls
+        _detect_cache: LRU cache of detection results, keyed by text
+        _translate_inflight: Running translations, so concurrent identical
+            requests share one API call
+        _detect_inflight: Running detections, so concurrent identical
+            requests share one API call
     """
 
+    __slots__ = (
+        "_http",
+        "_timeout",
+        "_skip_same_language",
+        "_semaphore",
+        "_detect_cache",
+        "_translate_inflight",
+        "_detect_inflight",
+    )
+
     # All language codes and names from googletrans
     LANGUAGE_CODES = googletrans.LANGUAGES
 
-    def __init__(self, timeout: int = 10):
+    # Google Translate endpoint used for translation and detection
+    API_URL = "https://translate.googleapis.com/translate_a/single"
+
+    # Longer text (in bytes once URL-encoded) is split into chunks, keeping
+    # the request URL well under the API's length limit
+    MAX_CHUNK_BYTES = 2000
+
+    # Read-only view handed out by get_available_languages()
+    _LANGS_VIEW = MappingProxyType(googletrans.LANGUAGES)
+
+    # Bound once; used for every detection result
+    _LANG_GET = googletrans.LANGUAGES.get
+
+    # Joins texts in a batched request; chosen to survive translation intact
+    BATCH_SEPARATOR = "\n%%\n"
+
+    # Maximum number of detection results kept in memory
+    DETECT_CACHE_SIZE = 2048
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        skip_same_language: bool = True,
+        max_concurrency: int = 6,
+    ):
         """
         Initialize the translator.
 
         Args:
             timeout: Maximum seconds to wait for API calls. Defaults to 10.
+            skip_same_language: Skip the API call when auto-detected text is
+                already in the target language. Only takes effect when the
+                optional gcld3 package is installed. Defaults to True.
+            max_concurrency: Maximum API calls in flight at once. Bursts
+                beyond this wait their turn instead of tripping Google's
+                rate limiting. Defaults to 6.
         """
-        self._translator = googletrans.Translator()
+        # The client enforces the timeout per request phase, so a request
+        # that times out is really cancelled and its connection released
+        self._http = httpx.AsyncClient(http2=True, timeout=timeout)
         self._timeout = timeout
+        self._skip_same_language = skip_same_language
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._detect_cache: OrderedDict[str, DetectionResult] = OrderedDict()
+        self._translate_inflight: dict[tuple[str, str, str], asyncio.Task] = {}
+        self._detect_inflight: dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def encoded_size(text: str) -> int:
+        """
+        Size of text as sent to the API, URL-encoded in the query string.
+
+        This is the size MAX_CHUNK_BYTES limits.
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            Length in bytes of the URL-encoded text.
+        """
+        return _encoded_size(text)
+
+    async def warm_up(self) -> None:
+        """
+        Open the HTTP connection to the translation service ahead of time.
+
+        The HTTP client keeps its connection open for reuse, so after this
+        the first translation doesn't pay for the TCP and TLS handshakes.
+        Failures are logged and ignored; the first real request will simply
+        connect itself.
+        """
+        try:
+            await self._http.head(self.API_URL)
+        except Exception as e:
+            logger.debug(f"Translator warm-up failed: {e}")
+
+    async def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        await self._http.aclose()
+
+    async def _request(self, text: str, target_code: str, source_code: str) -> list:
+        """
+        Send one translation request and return the decoded JSON response.
+
+        Args:
+            text: Text to translate
+            target_code: Target language code as the API expects it
+            source_code: Source language code, or "auto"
+
+        Returns:
+            The API's JSON response: a nested list whose first item holds
+            the translated segments and whose third item is the detected
+            source language.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        response = await self._http.get(
+            self.API_URL,
+            params={
+                "client": "gtx",
+                "sl": source_code,
+                "tl": target_code,
+                "dt": "t",
+                "q": text,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
 
     @staticmethod
     def normalize_language(language: str) -> Optional[str]:
@@ -71,6 +395,9 @@ class Translator:
         and converts them to ISO 639-1 codes. Special handling for Chinese
         variants (defaults to Simplified Chinese).
 
+        Results are memoized: the inputs seen in practice are a handful of
+        configured languages, so repeat calls are a single cache lookup.
+
         Args:
             language: Language name or code to normalize.
                 Examples: "english", "en", "spanish", "es", "chinese", "zh"
@@ -86,25 +413,10 @@ class Translator:
             >>> Translator.normalize_language("chinese")
             'chinese (simplified)'
         """
-        language_lower = language.lower().strip()
-
-        # Try direct code lookup first (e.g., "en" → "english")
-        if language_lower in googletrans.LANGUAGES:
-            return language_lower
-
-        # Try reverse lookup (e.g., "english" → "en")
-        for code, name in googletrans.LANGUAGES.items():
-            if name.lower() == language_lower:
-                # Special case: normalize Chinese variants
-                if "chinese" in name.lower():
-                    return "chinese (simplified)"
-                return code
-
-        # Partial match for Chinese variations
-        if "chinese" in language_lower or language_lower in ("zh", "ch"):
-            return "chinese (simplified)"
-
-        return None
+        # Already a canonical code (the usual case for internal callers)
+        if language in _VALID_CODES:
+            return language
+        return _normalize_language(language)
 
     async def translate(
         self, text: str, target_language: str, source_language: str = "auto"
@@ -112,8 +424,13 @@ class Translator:
         """
         Translate text to target language.
 
-        Delegates to Google Translate API via asyncio.to_thread() to avoid
-        blocking the event loop. Includes timeout protection.
+        Calls the Google Translate API asynchronously. Includes timeout
+        protection. Text over MAX_CHUNK_BYTES once URL-encoded is split,
+        on sentence boundaries where possible, and the chunks are
+        translated concurrently. Concurrent
+        calls with the same arguments share a single request. With source
+        "auto", text that the optional local detector (gcld3) reliably
+        identifies as the target language is returned without an API call.
 
         Args:
             text: Text to translate (can be empty, will return empty string)
@@ -121,7 +438,9 @@ class Translator:
             source_language: Source language code. Defaults to "auto" for detection.
 
         Returns:
-            Translated text, or empty string if text is empty.
+            Translated text, or empty string if text is empty. Text with no
+            letters (numbers, punctuation, emoji) is returned as-is, minus
+            surrounding whitespace.
 
         Raises:
             LanguageNotFoundError: If target language is not recognized
@@ -137,7 +456,35 @@ class Translator:
             >>> print(result)
             ''
         """
-        if not text or not text.strip():
+        return await self._translate(
+            text, target_language, source_language, check_language=True
+        )
+
+    async def _translate(
+        self,
+        text: str,
+        target_language: str,
+        source_language: str,
+        check_language: bool,
+    ) -> str:
+        """
+        Implementation of translate().
+
+        Args:
+            text: Text to translate
+            target_language: Target language code or name
+            source_language: Source language code, or "auto"
+            check_language: Run the local same-language check. Must be False
+                for joined batches: one verdict for the whole batch would
+                return every text in it untranslated.
+
+        Returns:
+            Translated text, as for translate().
+        """
+        # Surrounding whitespace would only count against the API's size
+        # limits, so it is stripped once here and never sent
+        text = text.strip()
+        if not text:
             return ""
 
         # Normalize target language
@@ -147,36 +494,265 @@ class Translator:
                 f"Language '{target_language}' is not recognized."
             )
 
+        # No letters (numbers, punctuation, emoji): nothing to translate
+        if _TRIVIAL.fullmatch(text):
+            return text
+
+        # Already in the target language: nothing to translate
+        if check_language and self._in_target_language(
+            text, target_language, source_language
+        ):
+            return text
+
+        key = (text, target_language, source_language)
+        task = self._translate_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._translate_text(text, target_language, source_language)
+            )
+            self._translate_inflight[key] = task
+            task.add_done_callback(
+                functools.partial(_inflight_done, self._translate_inflight, key)
+            )
+        else:
+            logger.debug("Joining in-flight translation")
+
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    def _in_target_language(
+        self, text: str, target_language: str, source_language: str
+    ) -> bool:
+        """
+        Check locally whether text is already in the target language.
+
+        Only with source "auto", skip_same_language enabled and gcld3
+        installed; otherwise always False.
+        """
+        return (
+            self._skip_same_language
+            and source_language == "auto"
+            and _detect_locally(text) == target_language
+        )
+
+    async def _translate_text(
+        self, text: str, target_language: str, source_language: str
+    ) -> str:
+        """
+        Translate text, splitting it into chunks if it is too long.
+
+        Args:
+            text: Text to translate
+            target_language: Normalized target language
+            source_language: Source language code, or "auto"
+
+        Returns:
+            Translated text.
+
+        Raises:
+            TranslationAPIError: If translation API call fails
+            asyncio.TimeoutError: If translation exceeds timeout
+        """
+        if self.encoded_size(text) <= self.MAX_CHUNK_BYTES:
+            return await self._translate_one(text, target_language, source_language)
+
+        # Too long for one request: translate chunks (sentence-aligned where
+        # possible) in parallel, keeping the whitespace that separated them
+        chunks = _split_text(text, self.MAX_CHUNK_BYTES)
+        results = await asyncio.gather(
+            *(self._translate_one(c, target_language, source_language) for c in chunks)
+        )
+        return "".join(
+            result.rstrip() + chunk[len(chunk.rstrip()) :]
+            for chunk, result in zip(chunks, results)
+        )
+
+    async def _limited_request(
+        self, text: str, target_code: str, source_code: str
+    ) -> list:
+        """
+        Send a request once a concurrency slot is free, under a deadline.
+
+        httpx applies its timeout to each phase (connect, read, ...) rather
+        than the whole call, and time spent waiting for a slot isn't covered
+        at all, so the wait and request together are capped at 1.5 times
+        the timeout as a safety net.
+
+        Raises:
+            asyncio.TimeoutError: If the slot and response take too long
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+
+        async def request() -> list:
+            async with self._semaphore:
+                return await self._request(text, target_code, source_code)
+
+        return await asyncio.wait_for(request(), timeout=self._timeout * 1.5)
+
+    async def _translate_one(
+        self, text: str, target_language: str, source_language: str
+    ) -> str:
+        """
+        Translate text with a single API call.
+
+        Args:
+            text: Text to translate
+            target_language: Normalized target language
+            source_language: Source language code, or "auto"
+
+        Returns:
+            Translated text.
+
+        Raises:
+            TranslationAPIError: If translation API call fails
+            asyncio.TimeoutError: If translation exceeds timeout
+        """
         try:
-            # Run translation in thread pool to avoid blocking event loop
-            result: Translated = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._translator.translate, text, target_language, source_language
-                ),
-                timeout=self._timeout,
+            data = await self._limited_request(
+                text, _api_code(target_language), _api_code(source_language)
             )
-            return result.text
-        except asyncio.TimeoutError:
+            # Long text comes back as one segment per sentence
+            return "".join(segment[0] for segment in data[0] or () if segment[0])
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
             logger.warning(
                 f"Translation timeout after {self._timeout}s for language {target_language}"
             )
-            raise
+            raise asyncio.TimeoutError(str(e)) from e
+        except _TRANSIENT_ERRORS as e:
+            logger.warning(f"Translation API error: {e}")
+            raise TranslationAPIError(str(e)) from e
         except Exception as e:
             logger.error(f"Translation API error: {e}", exc_info=True)
             raise TranslationAPIError(str(e)) from e
 
-    async def detect_language(self, text: str) -> Optional[str]:
+    async def translate_batch(
+        self, texts: list[str], target_language: str, source_language: str = "auto"
+    ) -> list[str]:
+        """
+        Translate several texts to one target language in a single API call.
+
+        The texts are joined with BATCH_SEPARATOR, translated together and
+        split back apart. The API takes one text per request, so joining is
+        what makes this a single call. If the translated output doesn't split
+        back into the same number of parts (the separator got mangled), each
+        text is translated on its own instead. Texts the local detector finds
+        already in the target language are checked one by one and left out
+        of the joined request.
+
+        Args:
+            texts: Texts to translate. Empty texts map to empty strings.
+            target_language: Target language code (e.g., "en", "es", "french")
+            source_language: Source language code. Defaults to "auto" for detection.
+
+        Returns:
+            Translated texts, in the same order as the input.
+
+        Raises:
+            LanguageNotFoundError: If target language is not recognized
+            TranslationAPIError: If translation API call fails
+            asyncio.TimeoutError: If translation exceeds timeout
+
+        Examples:
+            >>> await translator.translate_batch(["Hola", "Adiós"], "english")
+            ['Hello', 'Goodbye']
+        """
+        if len(texts) == 1:
+            return [await self.translate(texts[0], target_language, source_language)]
+
+        target = self.normalize_language(target_language)
+        if not target:
+            raise LanguageNotFoundError(
+                f"Language '{target_language}' is not recognized."
+            )
+
+        # Same-language check per text; the joined request skips it. Texts
+        # left out of the request are returned as-is.
+        results = [text.strip() for text in texts]
+        pending = [
+            i
+            for i, text in enumerate(results)
+            if not self._in_target_language(text, target, source_language)
+        ]
+        if len(pending) <= 1:
+            for i in pending:
+                results[i] = await self.translate(texts[i], target, source_language)
+            return results
+
+        joined = await self._translate(
+            self.BATCH_SEPARATOR.join(texts[i] for i in pending),
+            target,
+            source_language,
+            check_language=False,
+        )
+        parts = [part.strip() for part in joined.split(self.BATCH_SEPARATOR.strip())]
+        if len(parts) != len(pending):
+            logger.debug(
+                f"Batch split mismatch ({len(parts)} != {len(pending)}), "
+                "translating individually"
+            )
+            parts = await asyncio.gather(
+                *(self.translate(texts[i], target, source_language) for i in pending)
+            )
+        for i, part in zip(pending, parts):
+            results[i] = part
+        return results
+
+    async def translate_many(
+        self, texts: list[str], target_language: str, source_language: str = "auto"
+    ) -> list[str]:
+        """
+        Translate several texts concurrently, one API call per distinct text.
+
+        Unlike translate_batch(), which joins texts into one request, each
+        text gets its own request; the requests run in parallel, bounded by
+        the concurrency limit. Repeated texts share one request, and empty
+        or letterless texts skip the API as in translate().
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code (e.g., "en", "es", "french")
+            source_language: Source language code. Defaults to "auto" for detection.
+
+        Returns:
+            Translated texts, in the same order as the input.
+
+        Raises:
+            LanguageNotFoundError: If target language is not recognized
+            TranslationAPIError: If any translation API call fails
+            asyncio.TimeoutError: If any translation exceeds timeout
+
+        Examples:
+            >>> await translator.translate_many(["Hola", "Adiós"], "english")
+            ['Hello', 'Goodbye']
+        """
+        # Fail before sending anything if the language is unknown
+        if not self.normalize_language(target_language):
+            raise LanguageNotFoundError(
+                f"Language '{target_language}' is not recognized."
+            )
+
+        return list(
+            await asyncio.gather(
+                *(self.translate(t, target_language, source_language) for t in texts)
+            )
+        )
+
+    async def detect_language(self, text: str) -> Optional[DetectionResult]:
         """
         Detect the language of given text.
 
         Uses Google Translate's language detection. Returns the detected
         language code and confidence score.
 
+        Results are kept in an LRU cache of DETECT_CACHE_SIZE entries, and
+        concurrent calls for the same text share a single API call. Cached
+        results are returned as-is, not copied.
+
         Args:
             text: Text to detect language for.
 
         Returns:
-            Dictionary with detected language info:
+            DetectionResult (a read-only dict) with detected language info:
                 {
                     'code': 'es',
                     'name': 'spanish',
@@ -191,29 +767,60 @@ class Translator:
             >>> result = await translator.detect_language("Hola mundo")
             >>> print(result['code'])
             'es'
-            >>> print(result['name'])
+            >>> print(result.name)
             'spanish'
         """
-        if not text or not text.strip():
+        text = text.strip()
+        if not text or _TRIVIAL.fullmatch(text):
             return None
 
+        cached = self._detect_cache.get(text)
+        if cached is not None:
+            self._detect_cache.move_to_end(text)
+            return cached
+
+        task = self._detect_inflight.get(text)
+        if task is None:
+            task = asyncio.create_task(self._detect(text))
+            self._detect_inflight[text] = task
+            task.add_done_callback(
+                functools.partial(_inflight_done, self._detect_inflight, text)
+            )
+
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _detect(self, text: str) -> DetectionResult:
+        """Call the detection API and cache the result."""
         try:
-            result = await asyncio.to_thread(self._translator.detect, text)
-            return {
-                "code": result.lang,
-                "name": self.LANGUAGE_CODES.get(result.lang, result.lang),
-                "confidence": getattr(result, "confidence", 1.0),
-            }
+            # Detection comes for free with a translation request
+            data = await self._limited_request(text, "en", "auto")
+            code = data[2]
+            confidence = data[6] if len(data) > 6 and data[6] is not None else 1.0
+        except (*_TRANSIENT_ERRORS, asyncio.TimeoutError) as e:
+            logger.warning(f"Language detection error: {e!r}")
+            raise TranslationAPIError(str(e)) from e
         except Exception as e:
             logger.error(f"Language detection error: {e}", exc_info=True)
             raise TranslationAPIError(str(e)) from e
 
-    def get_available_languages(self) -> dict[str, str]:
+        detected = DetectionResult(
+            code=code, name=self._LANG_GET(code, code), confidence=confidence
+        )
+        self._detect_cache[text] = detected
+        if len(self._detect_cache) > self.DETECT_CACHE_SIZE:
+            self._detect_cache.popitem(last=False)
+        return detected
+
+    def get_available_languages(self) -> Mapping[str, str]:
         """
         Get all available language codes and their names.
 
+        Returns a read-only view rather than a copy; callers that need to
+        modify the mapping should copy it with dict() themselves.
+
         Returns:
-            Dictionary mapping language codes to language names.
+            Read-only mapping of language codes to language names.
             Example: {'en': 'english', 'es': 'spanish', ...}
         """
-        return dict(self.LANGUAGE_CODES)
+        return self._LANGS_VIEW